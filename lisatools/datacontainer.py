@@ -5,13 +5,17 @@ from typing import Any, Tuple, Optional, List
 import math
 import numpy as np
 from scipy import interpolate
+from scipy import fft as sfft
 import matplotlib.pyplot as plt
 
 try:
     import cupy as cp
 
+    HAS_CUPY = True
+
 except (ModuleNotFoundError, ImportError):
-    import numpy as cp
+    cp = None
+    HAS_CUPY = False
 
 from . import detector as lisa_models
 from .utils.utility import AET, get_array_module
@@ -40,6 +44,8 @@ class DataResidualArray:
         dt: Timestep in seconds.
         f_arr: Frequency array.
         df: Delta f in frequency domain.
+        use_threaded_fft: If ``True``, transform numpy time-domain inputs with
+            :func:`scipy.fft.rfft` using all available cores. Otherwise use :func:`numpy.fft.rfft`.
         **kwargs: For future compatibility.
 
     """
@@ -50,20 +56,27 @@ class DataResidualArray:
         dt: Optional[float] = None,
         f_arr: Optional[np.ndarray] = None,
         df: Optional[float] = None,
+        use_threaded_fft: bool = True,
         **kwargs: dict,
     ) -> None:
         if isinstance(data_res_in, DataResidualArray):
+            # build f_arr on the source so it and the copy share one array
+            data_res_in._build_f_arr()
             for key, item in data_res_in.__dict__.items():
                 setattr(self, key, item)
 
         else:
-            self._check_inputs(dt=dt, f_arr=f_arr, df=df)
-            self.data_res_arr = data_res_in
-            self._store_time_and_frequency_information(dt=dt, f_arr=f_arr, df=df)
+            self._check_inputs(
+                dt=dt, f_arr=f_arr, df=df, use_threaded_fft=use_threaded_fft
+            )
+            self._set_data_res_arr(data_res_in, time_domain=dt is not None)
+            self._store_time_and_frequency_information(
+                dt=dt, f_arr=f_arr, df=df, use_threaded_fft=use_threaded_fft
+            )
 
     @property
     def init_kwargs(self) -> dict:
-        """Initial dt, df, f_arr"""
+        """Initial dt, df, f_arr, use_threaded_fft"""
         return self._init_kwargs
 
     @init_kwargs.setter
@@ -76,6 +89,7 @@ class DataResidualArray:
         dt: Optional[float] = None,
         f_arr: Optional[np.ndarray] = None,
         df: Optional[float] = None,
+        use_threaded_fft: bool = True,
     ):
         number_of_none = 0
 
@@ -90,26 +104,48 @@ class DataResidualArray:
             raise ValueError(
                 "Can only provide one of dt, f_arr, or df. Not more than one."
             )
-        self.init_kwargs = dict(dt=dt, f_arr=f_arr, df=df)
+        self.init_kwargs = dict(
+            dt=dt, f_arr=f_arr, df=df, use_threaded_fft=use_threaded_fft
+        )
 
     def _store_time_and_frequency_information(
         self,
         dt: Optional[float] = None,
         f_arr: Optional[np.ndarray] = None,
         df: Optional[float] = None,
+        use_threaded_fft: bool = True,
     ):
         if dt is not None:
             self._dt = dt
             self._Tobs = self.data_length * dt
             self._df = 1 / self._Tobs
             self._fmax = 1 / (2 * dt)
-            self._f_arr = np.fft.rfftfreq(self.data_length, dt)
+            # f_arr is built on first access (see ``f_arr``)
+            self._f_arr = None
+            self._f_arr_params = (self.data_length, dt)
+
+            if self.xp.iscomplexobj(self._data_res_arr):
+                warnings.warn(
+                    "Complex input given with dt. The rfft only uses the real part; the imaginary part is discarded."
+                )
 
             # transform data
-            tmp = (
-                get_array_module(self.data_res_arr).fft.rfft(self.data_res_arr, axis=-1)
-                * self._dt
-            )
+            if self.xp is np and use_threaded_fft:
+                # time-domain input is real; scipy's pocketfft is threaded
+                tmp = sfft.rfft(
+                    self._data_res_arr.real,
+                    n=self.data_length,
+                    axis=-1,
+                    workers=-1,
+                    overwrite_x=True,
+                )
+            else:
+                tmp = self.xp.fft.rfft(
+                    self._data_res_arr.real, n=self.data_length, axis=-1
+                )
+
+            tmp *= self._dt
+            # release the real buffer
             del self._data_res_arr
             self._data_res_arr = tmp
             self.data_length = self._data_res_arr.shape[-1]
@@ -119,14 +155,39 @@ class DataResidualArray:
             self._Tobs = 1 / self._df
             self._fmax = (self.data_length - 1) * df
             self._dt = 1 / (2 * self._fmax)
-            self._f_arr = np.arange(0.0, self._fmax, self._df)
+            self._f_arr = np.linspace(
+                0.0, self._fmax, self.data_length, dtype=np.float64
+            )
 
         elif f_arr is not None:
+            if len(f_arr) != self.data_length:
+                raise ValueError(
+                    "Entered f_arr does not have the same length as the data channel inputs."
+                )
+
             self._f_arr = f_arr
             self._fmax = f_arr.max()
-            # constant spacing
-            if np.all(np.diff(f_arr) == np.diff(f_arr)[0]):
-                self._df = np.diff(f_arr)[0].item()
+            # constant spacing (up to floating point roundoff in f_arr)
+            # cheap look at the ends first so non-uniform grids skip the full diff
+            uniform = len(f_arr) > 1
+            if uniform:
+                # first spacing, shared by every check below and by df
+                d0 = float(f_arr[1] - f_arr[0])
+
+            if len(f_arr) > 2:
+                dN = f_arr[-1] - f_arr[-2]
+                dmean = (f_arr[-1] - f_arr[0]) / (len(f_arr) - 1)
+                # relative-only: df of long LISA grids is below isclose's default atol
+                uniform = np.isclose(d0, dN, rtol=1e-5, atol=0.0) and np.isclose(
+                    d0, dmean, rtol=1e-5, atol=0.0
+                )
+
+            if uniform:
+                tol = 4 * np.finfo(np.float64).eps * max(abs(self._fmax), abs(d0))
+                uniform = np.ptp(np.diff(f_arr)) <= tol
+
+            if uniform:
+                self._df = d0
 
                 if f_arr[0] == 0.0:
                     # could be fft because of constant spacing and f_arr[0] == 0.0
@@ -143,10 +204,8 @@ class DataResidualArray:
                 self._Tobs = None
                 self._dt = None
 
-        if len(self.f_arr) != self.data_length:
-            raise ValueError(
-                "Entered or determined f_arr does not have the same length as the data channel inputs."
-            )
+        # dt and df inputs determine f_arr with the right length by construction
+        assert self._f_arr is None or len(self._f_arr) == self.data_length
 
     @property
     def fmax(self):
@@ -156,8 +215,15 @@ class DataResidualArray:
     @property
     def f_arr(self):
         """Frequency array."""
+        self._build_f_arr()
         return self._f_arr
 
+    def _build_f_arr(self) -> None:
+        """Build the rfft frequencies of time-domain input if not done yet."""
+        if self._f_arr is None:
+            n, dt = self._f_arr_params
+            self._f_arr = np.arange(n // 2 + 1) * (1.0 / (n * dt))
+
     @property
     def dt(self):
         """Time step in seconds."""
@@ -185,7 +251,7 @@ class DataResidualArray:
     @property
     def frequency_arr(self) -> np.ndarray:
         """Frequency array"""
-        return self._f_arr
+        return self.f_arr
 
     @property
     def data_res_arr(self) -> np.ndarray:
@@ -195,36 +261,64 @@ class DataResidualArray:
     @data_res_arr.setter
     def data_res_arr(self, data_res_arr: List[np.ndarray] | np.ndarray) -> None:
         """Set ``data_res_arr``."""
+        self._set_data_res_arr(data_res_arr)
+
+    def _set_data_res_arr(
+        self,
+        data_res_arr: List[np.ndarray] | np.ndarray,
+        time_domain: bool = False,
+    ) -> None:
+        """Stack the channels of ``data_res_arr`` into one 2D array.
+
+        Args:
+            data_res_arr: Channel arrays to store.
+            time_domain: If ``True`` and all channels are real, store them as float64
+                for the Fourier transform. Otherwise the data is stored as complex.
+
+        """
         self._data_res_arr_input = data_res_arr
 
-        if (
-            isinstance(data_res_arr, np.ndarray) or isinstance(data_res_arr, cp.ndarray)
-        ) and data_res_arr.ndim == 1:
+        is_array = isinstance(data_res_arr, np.ndarray) or (
+            HAS_CUPY and isinstance(data_res_arr, cp.ndarray)
+        )
+        if is_array and data_res_arr.ndim == 1:
             data_res_arr = [data_res_arr]
 
-        elif (
-            isinstance(data_res_arr, np.ndarray) or isinstance(data_res_arr, cp.ndarray)
-        ) and data_res_arr.ndim == 2:
+        elif is_array and data_res_arr.ndim == 2:
             data_res_arr = list(data_res_arr)
 
-        new_out = np.full(len(data_res_arr), None, dtype=object)
-        self.data_length = None
-        for i in range(len(data_res_arr)):
-            current_data = data_res_arr[i]
-            if isinstance(current_data, np.ndarray) or isinstance(
-                current_data, cp.ndarray
-            ):
-                if self.data_length is None:
-                    self.data_length = len(current_data)
-                else:
-                    assert len(current_data) == self.data_length
+        nchannels = len(data_res_arr)
+        data_length = len(data_res_arr[0])
 
-                new_out[i] = current_data
-            else:
+        # keep cupy inputs on the device
+        xp = get_array_module(data_res_arr[0])
+
+        # real time-domain input only needs half the memory until it is transformed
+        if time_domain and not any(
+            xp.iscomplexobj(current_data) for current_data in data_res_arr
+        ):
+            dtype = xp.float64
+        else:
+            dtype = xp.complex128
+
+        # allocate the final 2D array once and fill it channel by channel
+        out = xp.empty((nchannels, data_length), dtype=dtype)
+        for i, current_data in enumerate(data_res_arr):
+            if not (
+                isinstance(current_data, np.ndarray)
+                or (HAS_CUPY and isinstance(current_data, cp.ndarray))
+            ):
                 raise ValueError
+            assert len(current_data) == data_length
+            out[i] = xp.asarray(current_data)
 
-        self.nchannels = len(new_out)
-        self._data_res_arr = np.asarray(list(new_out), dtype=complex)
+        self.nchannels, self.data_length = out.shape
+        self._data_res_arr = out
+
+    @property
+    def xp(self):
+        """Array module (numpy or cupy) holding ``data_res_arr``."""
+        return get_array_module(self._data_res_arr)
 
     def __getitem__(self, index: tuple) -> np.ndarray:
         """Index this class directly in ``self.data_res_arr``."""